@@ -6,27 +6,161 @@ Run with: python -m racgoat
 This makes the package executable as a module - how 'goat' is that? 🐐
 """
 
+import argparse
 import os
 import sys
-import signal
-import subprocess
-import tempfile
-import selectors
 
 from racgoat.cli.args import parse_arguments
-from racgoat.main import main, run_tui
-from racgoat.parser.diff_parser import DiffParser
 from racgoat.exceptions import DiffTooLargeError
 
+# The parser (and its dataclass models) is imported inside each mode runner,
+# after argparse has handled --help/--version - the goat doesn't pack for a
+# trip it isn't taking.
+
+
+def _exit_diff_too_large(error: DiffTooLargeError) -> None:
+    """Report an oversized diff on stderr and exit with status 1.
+
+    Args:
+        error: The DiffTooLargeError raised by the parser
+    """
+    sys.stderr.write("\n🦝 This diff is too large!\n\n")
+    sys.stderr.write(f"RacGoat can handle up to {error.limit:,} lines,\n")
+    sys.stderr.write(f"but this diff has {error.actual_lines:,}.\n\n")
+    sys.stderr.write("Consider reviewing in smaller chunks. 🐐\n\n")
+    sys.exit(1)
+
+
+def _run_diff_file(args: argparse.Namespace) -> None:
+    """Parse the diff file given via --diff-file and launch the TUI."""
+    from racgoat.main import main, run_tui
+    from racgoat.parser.diff_parser import DiffParser, iter_diff_lines
+
+    try:
+        with open(args.diff_file, "rb") as f:
+            parser = DiffParser()
+            diff_summary = parser.parse_lines(iter_diff_lines(f.fileno()))
+        run_tui(diff_summary, output_file=args.output)
+    except DiffTooLargeError as e:
+        _exit_diff_too_large(e)
+    except (OSError, IOError):
+        # Fallback to legacy mode on file read error
+        main(diff_file=args.diff_file, output_file=args.output)
+
+
+def _run_git_diff(args: argparse.Namespace) -> None:
+    """Interactive mode: run git diff in the current directory and launch the TUI.
+
+    git is started first and Textual is imported while it runs, so startup
+    costs max(git, import) rather than their sum.
+    """
+    import subprocess
+
+    from racgoat.parser.diff_parser import DiffParser
+    from racgoat.parser.models import DiffSummary
+
+    # Determine which git command to run based on -s flag; user config
+    # (color.diff, diff.external) must not change what the parser sees
+    git_cmd = ["git", "diff", "--no-color", "--no-ext-diff"]
+    if args.staged:
+        git_cmd.append("--staged")
+
+    try:
+        git_process = subprocess.Popen(
+            git_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        # git not installed
+        git_process = None
+
+    # Heavy TUI import overlaps with git doing its work
+    from racgoat.main import run_tui
+
+    diff_summary = DiffSummary(files=[])
+    if git_process is not None:
+        try:
+            stdout, _ = git_process.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            git_process.kill()
+            git_process.communicate()
+        else:
+            # Only parse if git diff succeeded and returned content
+            if git_process.returncode == 0 and stdout.strip():
+                try:
+                    diff_summary = DiffParser().parse(
+                        stdout.decode("utf-8", errors="replace")
+                    )
+                except DiffTooLargeError:
+                    pass  # Too large - show empty state
+
+    run_tui(diff_summary, output_file=args.output)
+
+
+def _run_headless(args: argparse.Namespace) -> None:
+    """Headless mode: stdout is captured/redirected, use CLI text output.
+
+    This happens in CI/CD, subprocess.run(..., capture_output=True), or
+    non-interactive shells.
+    """
+    from racgoat.parser.diff_parser import DiffParser, iter_stream_lines
+
+    try:
+        parser = DiffParser()
+        diff_summary = parser.parse_lines(iter_stream_lines(sys.stdin))
+
+        # Only write output if there are files to report
+        if not diff_summary.is_empty:
+            with open(args.output, 'w') as f:
+                f.write(diff_summary.format_output())
+
+        sys.exit(0)
+    except DiffTooLargeError as e:
+        _exit_diff_too_large(e)
+    except Exception as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
+
+
+def _run_piped_tui(args: argparse.Namespace) -> None:
+    """Piped stdin with a TTY on stdout: launch the TUI on /dev/tty.
+
+    The whole diff is parsed from the pipe first, then the controlling
+    terminal is dup'ed onto fd 0 so Textual reads keys from it in this same
+    process - no child interpreter needed.
+    """
+    from racgoat.main import run_tui
+    from racgoat.parser.diff_parser import DiffParser, iter_stream_lines
+
+    try:
+        parser = DiffParser()
+        diff_summary = parser.parse_lines(iter_stream_lines(sys.stdin))
+    except DiffTooLargeError as e:
+        _exit_diff_too_large(e)
+        return
+
+    try:
+        tty_fd = os.open("/dev/tty", os.O_RDONLY)
+    except OSError:
+        # No /dev/tty available - launch TUI on stdin as-is
+        pass
+    else:
+        # sys.__stdin__ wraps fd 0, so Textual's driver picks up the terminal
+        os.dup2(tty_fd, 0)
+        os.close(tty_fd)
+
+    run_tui(diff_summary, output_file=args.output)
+
 
 def run() -> None:
     """
     Main entry point that handles both piped stdin and interactive mode.
 
     When stdin is piped (e.g., `git diff | racgoat`):
-      - Writes stdin to a temp file
-      - Spawns subprocess with stdin redirected to /dev/tty
-      - Parent copies stdin data while child runs TUI
+      - Reads the whole diff from stdin
+      - Redirects fd 0 to /dev/tty and launches TUI in current process
+      - Falls back to plain text output when stdout is not a TTY
 
     When stdin is a tty (interactive):
       - Launches TUI directly in current process
@@ -36,159 +170,17 @@ def run() -> None:
     # Parse arguments (both modes need -o flag)
     args = parse_arguments()
 
-    # Check if we're the child process (have --diff-file from parent)
-    if hasattr(args, 'diff_file') and args.diff_file:
-        # Child process - parse diff file and launch TUI (Milestone 2)
-        try:
-            with open(args.diff_file, "r") as f:
-                diff_input = f.read()
-            parser = DiffParser()
-            diff_summary = parser.parse(diff_input)
-            run_tui(diff_summary, output_file=args.output)
-        except DiffTooLargeError as e:
-            # Show error and exit
-            sys.stderr.write(f"\n🦝 This diff is too large!\n\n")
-            sys.stderr.write(f"RacGoat can handle up to {e.limit:,} lines,\n")
-            sys.stderr.write(f"but this diff has {e.actual_lines:,}.\n\n")
-            sys.stderr.write(f"Consider reviewing in smaller chunks. 🐐\n\n")
-            sys.exit(1)
-        except (OSError, IOError):
-            # Fallback to legacy mode on file read error
-            main(diff_file=args.diff_file, output_file=args.output)
+    # Diff supplied as a file path (hidden --diff-file flag)
+    if args.diff_file:
+        _run_diff_file(args)
     elif stdin_tty:
-        # Interactive mode - try to run git diff automatically
-        from racgoat.parser.models import DiffSummary
-
-        try:
-            # Determine which git command to run based on -s flag
-            git_cmd = ["git", "diff", "--staged"] if args.staged else ["git", "diff"]
-
-            # Try to run git diff in the current directory
-            result = subprocess.run(
-                git_cmd,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            # Check if git diff succeeded and returned content
-            if result.returncode == 0 and result.stdout.strip():
-                # Parse the git diff output
-                parser = DiffParser()
-                diff_summary = parser.parse(result.stdout)
-                run_tui(diff_summary, output_file=args.output)
-            else:
-                # git diff failed or returned empty, show empty state
-                run_tui(DiffSummary(files=[]), output_file=args.output)
-        except (subprocess.TimeoutExpired, FileNotFoundError, DiffTooLargeError):
-            # git not found, timeout, or diff too large - show empty state
-            run_tui(DiffSummary(files=[]), output_file=args.output)
+        _run_git_diff(args)
+    elif not sys.stdout.isatty():
+        # Check stdout FIRST before trying /dev/tty to handle
+        # subprocess.run with capture_output=True
+        _run_headless(args)
     else:
-        # Piped stdin mode - check if stdout is captured (headless mode)
-        # Check stdout FIRST before trying /dev/tty to handle subprocess.run with capture_output=True
-        if not sys.stdout.isatty():
-            # Headless mode: stdout is captured/redirected, use CLI text output
-            # This happens in CI/CD, subprocess.run(..., capture_output=True), or non-interactive shells
-            stdin_data = sys.stdin.read()
-            try:
-                parser = DiffParser()
-                diff_summary = parser.parse(stdin_data)
-
-                # Only write output if there are files to report
-                if not diff_summary.is_empty:
-                    with open(args.output, 'w') as f:
-                        f.write(diff_summary.format_output())
-
-                sys.exit(0)
-            except DiffTooLargeError as e:
-                # Show error and exit
-                sys.stderr.write(f"\n🦝 This diff is too large!\n\n")
-                sys.stderr.write(f"RacGoat can handle up to {e.limit:,} lines,\n")
-                sys.stderr.write(f"but this diff has {e.actual_lines:,}.\n\n")
-                sys.stderr.write(f"Consider reviewing in smaller chunks. 🐐\n\n")
-                sys.exit(1)
-            except Exception as e:
-                sys.stderr.write(f"Error: {e}\n")
-                sys.exit(1)
-        else:
-            # stdout is a TTY - check if /dev/tty is available for interactive TUI
-            try:
-                # Try to open /dev/tty - if this fails, we can't run TUI interactively
-                with open("/dev/tty", "rb"):
-                    pass
-                has_tty = True
-            except (OSError, IOError):
-                has_tty = False
-
-            if not has_tty:
-                # No /dev/tty available but stdout is a TTY
-                # Read stdin and try to launch TUI directly
-                stdin_data = sys.stdin.read()
-                try:
-                    parser = DiffParser()
-                    diff_summary = parser.parse(stdin_data)
-                    run_tui(diff_summary, output_file=args.output)
-                except DiffTooLargeError as e:
-                    # Show error and exit
-                    sys.stderr.write(f"\n🦝 This diff is too large!\n\n")
-                    sys.stderr.write(f"RacGoat can handle up to {e.limit:,} lines,\n")
-                    sys.stderr.write(f"but this diff has {e.actual_lines:,}.\n\n")
-                    sys.stderr.write(f"Consider reviewing in smaller chunks. 🐐\n\n")
-                    sys.exit(1)
-            else:
-                # /dev/tty available - use toolong pattern for proper interactive TUI
-                def request_exit(*args_signal) -> None:
-                    """Handle interrupts gracefully."""
-                    sys.stderr.write("^C\n")
-
-                signal.signal(signal.SIGINT, request_exit)
-                signal.signal(signal.SIGTERM, request_exit)
-
-                # Write piped data to temp file
-                with tempfile.NamedTemporaryFile(
-                    mode="w+",
-                    delete=False,
-                    prefix="racgoat_",
-                    suffix=".diff"
-                ) as temp_file:
-                    temp_path = temp_file.name
-
-                    try:
-                        # Open /dev/tty for subprocess stdin
-                        with open("/dev/tty", "rb", buffering=0) as tty_stdin:
-                            # Launch subprocess to render TUI
-                            process = subprocess.Popen(
-                                [sys.executable, "-m", "racgoat", "-o", args.output, "--diff-file", temp_path],
-                                stdin=tty_stdin,
-                                close_fds=True,
-                                env={**os.environ, "TEXTUAL_ALLOW_SIGNALS": "1"}
-                            )
-
-                            # Copy stdin to temp file while TUI runs
-                            selector = selectors.SelectSelector()
-                            selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
-
-                            while process.poll() is None:
-                                for _, event in selector.select(0.1):
-                                    if process.poll() is not None:
-                                        break
-                                    chunk = sys.stdin.read(8192)
-                                    if chunk:
-                                        temp_file.write(chunk)
-                                        temp_file.flush()
-                                    else:
-                                        # EOF reached
-                                        break
-
-                            # Wait for process to complete
-                            process.wait()
-
-                    finally:
-                        # Clean up temp file
-                        try:
-                            os.unlink(temp_path)
-                        except OSError:
-                            pass
+        _run_piped_tui(args)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 import sys
 
 from racgoat.cli.args import parse_arguments
-from racgoat.parser.diff_parser import parse_diff
+from racgoat.parser.diff_parser import iter_stream_lines, parse_diff
 
 
 def main():
@@ -20,11 +20,8 @@ def main():
         # Parse command-line arguments
         args = parse_arguments()
 
-        # Read diff from stdin
-        stdin_lines = sys.stdin.readlines()
-
-        # Parse the diff
-        summary = parse_diff(stdin_lines)
+        # Stream and parse the diff from stdin
+        summary = parse_diff(iter_stream_lines(sys.stdin))
 
         # Only write output if there are files to report
         if not summary.is_empty:
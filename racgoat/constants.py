@@ -34,6 +34,12 @@ STATUS_BAR_HEIGHT = 1  # Status bar height (rows)
 MAX_DIFF_LINES = 10_000  # Maximum total diff lines supported
 MAX_FILES = 100  # Maximum number of files in a diff
 
+# Piped Input
+STDIN_CHUNK_SIZE = 1 << 20  # Read buffer size for streaming piped stdin (1 MiB)
+
+# Review Saving
+QUIT_OFFLOAD_MIN_LINES = 2_000  # Diffs this large serialize/write the review in a worker thread
+
 # Comment Limits
 MAX_COMMENT_LENGTH = 10_000  # Maximum characters per comment
 
@@ -0,0 +1,55 @@
+"""Base Controller - Shared plumbing for all RacGoat controllers.
+
+The raccoon remembers where its den is - no need to sniff it out every time!
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from racgoat.main import RacGoatApp
+    from racgoat.ui.widgets import DiffPane, FilesPane, TwoPaneLayout
+    from racgoat.ui.widgets.status_bar import StatusBar
+
+
+class BaseController:
+    """Base class for controllers with cached widget lookups."""
+
+    __slots__ = ("app",)
+
+    def __init__(self, app: "RacGoatApp"):
+        """Initialize the controller.
+
+        Args:
+            app: Reference to the main RacGoatApp instance
+        """
+        self.app = app
+
+    @property
+    def two_pane(self) -> "TwoPaneLayout | None":
+        """The app's TwoPaneLayout, as cached by RacGoatApp.compose.
+
+        Returns:
+            The layout, or None if it isn't composed (e.g. empty diff)
+        """
+        return self.app._two_pane
+
+    @property
+    def diff_pane(self) -> "DiffPane | None":
+        """The DiffPane inside the cached layout (None if unavailable)."""
+        two_pane = self.app._two_pane
+        return two_pane._diff_pane if two_pane else None
+
+    @property
+    def files_pane(self) -> "FilesPane | None":
+        """The FilesPane inside the cached layout (None if unavailable)."""
+        two_pane = self.app._two_pane
+        return two_pane._files_pane if two_pane else None
+
+    @property
+    def status_bar(self) -> "StatusBar | None":
+        """The app's StatusBar, as cached by RacGoatApp.compose.
+
+        Returns:
+            The status bar, or None if it isn't composed (e.g. empty diff)
+        """
+        return self.app._status_bar
@@ -3,35 +3,41 @@
 The raccoon's treasure stashing logic lives here!
 """
 
-from datetime import datetime
 from typing import TYPE_CHECKING
 
+from racgoat.controllers.base import BaseController
 from racgoat.models.comments import Comment, CommentTarget, CommentType
 from racgoat.ui.models import ApplicationMode
+from racgoat.ui.widgets.comment_input import CommentInput
+from racgoat.ui.widgets.dialogs import ConfirmDialog
+from racgoat.utils import line_span, ordered
 
 if TYPE_CHECKING:
     from racgoat.main import RacGoatApp
 
 
-class CommentController:
+class CommentController(BaseController):
     """Controller for comment-related actions."""
 
-    def __init__(self, app: "RacGoatApp"):
-        """Initialize the comment controller.
+    __slots__ = ()
 
-        Args:
-            app: Reference to the main RacGoatApp instance
-        """
-        self.app = app
+    # Notification templates, formatted only on the branch that fires
+    _LINE_ADD_FMT = "Comment added to line {}"
+    _LINE_UPDATE_FMT = "Comment updated on line {}"
+    _LINE_DELETE_FMT = "Comment deleted from line {}"
+    _FILE_ADD_FMT = "File comment added: {}"
+    _FILE_UPDATE_FMT = "File comment updated: {}"
+    _FILE_DELETE_FMT = "File comment deleted: {}"
 
     def _prompt_for_comment(
         self,
         target: CommentTarget,
         comment_type: CommentType,
         prompt_text: str,
-        success_message_add: str,
-        success_message_update: str,
-        success_message_delete: str,
+        subject: str | int,
+        add_fmt: str,
+        update_fmt: str,
+        delete_fmt: str,
         diff_pane,
     ) -> None:
         """Unified comment prompting logic.
@@ -40,16 +46,21 @@ class CommentController:
             target: The comment target (file/line/range)
             comment_type: Type of comment (LINE/FILE/RANGE)
             prompt_text: Text to show in prompt dialog
-            success_message_add: Notification message when adding
-            success_message_update: Notification message when updating
-            success_message_delete: Notification message when deleting
+            subject: Line number or file path substituted into the templates
+            add_fmt: Notification template when adding
+            update_fmt: Notification template when updating
+            delete_fmt: Notification template when deleting
             diff_pane: Reference to diff pane for refresh
         """
         # Check if comment exists at target (for editing)
-        existing_comments = self.app.comment_store.get(
-            target.file_path, target.line_number
-        )
-        prefill = existing_comments[0].text if existing_comments else ""
+        existing_comment = self.app.comment_store.get_one(target)
+        prefill = existing_comment.text if existing_comment else ""
+
+        # Only the affected lines change marker; file comments redraw it all.
+        # An existing comment may be a range covering this line - its whole
+        # span changes when it is edited or deleted.
+        changed = existing_comment.target if existing_comment else target
+        dirty_lines = changed.line_range or line_span(changed.line_number)
 
         # Define callback to handle modal result
         def handle_comment_result(result: str | None) -> None:
@@ -58,18 +69,16 @@ class CommentController:
                 return
 
             # Check for empty string when editing existing comment (deletion request)
-            if result == "" and existing_comments:
+            if result == "" and existing_comment:
                 # Show confirmation dialog for deletion
-                from racgoat.ui.widgets.dialogs import ConfirmDialog
-
                 def handle_delete_confirmation(confirmed: bool) -> None:
                     if confirmed:
                         # Delete the comment
-                        self.app.comment_store.delete(existing_comments[0].id)
-                        self.app.notify(success_message_delete, severity="information")
+                        self.app.comment_store.delete(existing_comment.id)
+                        self.app.notify(delete_fmt.format(subject), severity="information")
                         # Refresh display to remove marker
-                        if diff_pane and diff_pane.current_file:
-                            diff_pane.display_file(diff_pane.current_file, refresh_only=True)
+                        if diff_pane:
+                            diff_pane.schedule_redraw(dirty_lines)
 
                 self.app.push_screen(
                     ConfirmDialog(
@@ -81,28 +90,25 @@ class CommentController:
                 return
 
             if result:  # User provided text
-                if existing_comments:
+                if existing_comment:
                     # Update existing comment
                     self.app.comment_store.update(target, result)
-                    self.app.notify(success_message_update, severity="information")
+                    self.app.notify(update_fmt.format(subject), severity="information")
                 else:
                     # Create new comment
                     comment = Comment(
                         text=result,
                         target=target,
-                        timestamp=datetime.now(),
                         comment_type=comment_type,
                     )
                     self.app.comment_store.add(comment)
-                    self.app.notify(success_message_add, severity="information")
+                    self.app.notify(add_fmt.format(subject), severity="information")
 
                 # Refresh display to show marker
-                if diff_pane and diff_pane.current_file:
-                    diff_pane.display_file(diff_pane.current_file, refresh_only=True)
+                if diff_pane:
+                    diff_pane.schedule_redraw(dirty_lines)
 
         # Show input modal with callback
-        from racgoat.ui.widgets.comment_input import CommentInput
-
         self.app.push_screen(
             CommentInput(
                 prompt=prompt_text,
@@ -118,14 +124,11 @@ class CommentController:
         The raccoon stashes a thought about this line!
         """
         # Only in NORMAL mode
-        if self.app.mode != ApplicationMode.NORMAL:
+        if self.app.mode is not ApplicationMode.NORMAL:
             return
 
         # Get current file and line from DiffPane
-        from racgoat.ui.widgets import TwoPaneLayout
-
-        two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-        diff_pane = two_pane._diff_pane
+        diff_pane = self.diff_pane
 
         if not diff_pane or not diff_pane.current_file or diff_pane.current_line is None:
             self.app.notify("No line selected for comment", severity="warning")
@@ -134,17 +137,16 @@ class CommentController:
         file_path = diff_pane.current_file.file_path
         line_number = diff_pane.current_line
 
-        target = CommentTarget(
-            file_path=file_path, line_number=line_number, line_range=None
-        )
+        target = CommentTarget(file_path, line_number)
 
         self._prompt_for_comment(
             target=target,
             comment_type=CommentType.LINE,
             prompt_text=f"Comment on line {line_number}:",
-            success_message_add=f"Comment added to line {line_number}",
-            success_message_update=f"Comment updated on line {line_number}",
-            success_message_delete=f"Comment deleted from line {line_number}",
+            subject=line_number,
+            add_fmt=self._LINE_ADD_FMT,
+            update_fmt=self._LINE_UPDATE_FMT,
+            delete_fmt=self._LINE_DELETE_FMT,
             diff_pane=diff_pane,
         )
 
@@ -154,14 +156,11 @@ class CommentController:
         The goat bleats wisdom about the entire file!
         """
         # Only in NORMAL mode
-        if self.app.mode != ApplicationMode.NORMAL:
+        if self.app.mode is not ApplicationMode.NORMAL:
             return
 
         # Get current file
-        from racgoat.ui.widgets import TwoPaneLayout
-
-        two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-        diff_pane = two_pane._diff_pane
+        diff_pane = self.diff_pane
 
         if not diff_pane or not diff_pane.current_file:
             self.app.notify("No file selected for comment", severity="warning")
@@ -169,15 +168,16 @@ class CommentController:
 
         file_path = diff_pane.current_file.file_path
 
-        target = CommentTarget(file_path=file_path, line_number=None, line_range=None)
+        target = CommentTarget(file_path)
 
         self._prompt_for_comment(
             target=target,
             comment_type=CommentType.FILE,
             prompt_text=f"Comment on file {file_path}:",
-            success_message_add=f"File comment added: {file_path}",
-            success_message_update=f"File comment updated: {file_path}",
-            success_message_delete=f"File comment deleted: {file_path}",
+            subject=file_path,
+            add_fmt=self._FILE_ADD_FMT,
+            update_fmt=self._FILE_UPDATE_FMT,
+            delete_fmt=self._FILE_DELETE_FMT,
             diff_pane=diff_pane,
         )
 
@@ -186,14 +186,11 @@ class CommentController:
 
         The raccoon starts marking a range of treasures!
         """
-        if self.app.mode != ApplicationMode.NORMAL:
+        if self.app.mode is not ApplicationMode.NORMAL:
             return
 
         # Get DiffPane
-        from racgoat.ui.widgets import TwoPaneLayout
-
-        two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-        diff_pane = two_pane._diff_pane
+        diff_pane = self.diff_pane
 
         if not diff_pane or not diff_pane.current_file or diff_pane.current_line is None:
             self.app.notify("No line selected for range selection", severity="warning")
@@ -205,7 +202,7 @@ class CommentController:
         diff_pane.select_end_line = diff_pane.current_line
 
         # Refresh display to show selection highlighting
-        diff_pane.display_file(diff_pane.current_file, refresh_only=True)
+        diff_pane.schedule_redraw(line_span(diff_pane.current_line))
 
         self.app.notify("SELECT mode: Use ↑/↓ to expand, Enter to confirm, Esc to cancel", severity="information")
 
@@ -214,20 +211,21 @@ class CommentController:
 
         The raccoon abandons the selection!
         """
-        if self.app.mode == ApplicationMode.SELECT:
+        if self.app.mode is ApplicationMode.SELECT:
             self.app.mode = ApplicationMode.NORMAL
 
             # Clear selection in DiffPane
-            from racgoat.ui.widgets import TwoPaneLayout
-
-            two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-            diff_pane = two_pane._diff_pane
+            diff_pane = self.diff_pane
             if diff_pane:
+                dirty_lines = line_span(
+                    diff_pane.select_start_line,
+                    diff_pane.select_end_line,
+                    diff_pane.current_line,
+                )
                 diff_pane.select_start_line = None
                 diff_pane.select_end_line = None
                 # Refresh display to remove visual highlight
-                if diff_pane.current_file:
-                    diff_pane.display_file(diff_pane.current_file, refresh_only=True)
+                diff_pane.schedule_redraw(dirty_lines)
 
             self.app.notify("SELECT mode cancelled", severity="information")
 
@@ -236,14 +234,11 @@ class CommentController:
 
         The raccoon finalizes the selection and stashes wisdom!
         """
-        if self.app.mode != ApplicationMode.SELECT:
+        if self.app.mode is not ApplicationMode.SELECT:
             return
 
         # Get selection from DiffPane
-        from racgoat.ui.widgets import TwoPaneLayout
-
-        two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-        diff_pane = two_pane._diff_pane
+        diff_pane = self.diff_pane
 
         if not diff_pane or not diff_pane.current_file:
             self.app.notify("No file selected for range comment", severity="warning")
@@ -254,39 +249,29 @@ class CommentController:
             return
 
         file_path = diff_pane.current_file.file_path
-        start_line = min(diff_pane.select_start_line, diff_pane.select_end_line)
-        end_line = max(diff_pane.select_start_line, diff_pane.select_end_line)
+        start_line, end_line = ordered(diff_pane.select_start_line, diff_pane.select_end_line)
 
-        # Exit SELECT mode first
+        # Exit SELECT mode first and repaint the hunks that showed the selection
         self.app.mode = ApplicationMode.NORMAL
         diff_pane.select_start_line = None
         diff_pane.select_end_line = None
+        diff_pane.schedule_redraw(
+            line_span(start_line, end_line, diff_pane.current_line)
+        )
 
         # Define callback to handle modal result
         def handle_comment_result(result: str | None) -> None:
             if result:  # User provided text
-                target = CommentTarget(
-                    file_path=file_path,
-                    line_number=None,
-                    line_range=(start_line, end_line)
-                )
-
                 # Create range comment
-                comment = Comment(
-                    text=result,
-                    target=target,
-                    timestamp=datetime.now(),
-                    comment_type=CommentType.RANGE
-                )
+                comment = Comment.new_range(file_path, start_line, end_line, result)
                 self.app.comment_store.add(comment)
                 self.app.notify(f"Range comment added (lines {start_line}-{end_line})", severity="information")
 
                 # Refresh display to show markers
-                diff_pane.display_file(diff_pane.current_file, refresh_only=True)
+                diff_pane.schedule_redraw((start_line, end_line))
 
         # Prompt for comment text
         prompt = f"Comment on lines {start_line}-{end_line}:"
-        from racgoat.ui.widgets.comment_input import CommentInput
         self.app.push_screen(
             CommentInput(
                 prompt=prompt,
@@ -302,10 +287,7 @@ class CommentController:
         The goat polishes its treasured notes!
         """
         # Get DiffPane and delegate to its edit action
-        from racgoat.ui.widgets import TwoPaneLayout
-
-        two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-        diff_pane = two_pane._diff_pane
+        diff_pane = self.diff_pane
 
         if diff_pane:
             diff_pane.action_edit_comment()
@@ -3,38 +3,37 @@
 The raccoon's final treasure stashing before departure!
 """
 
+import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-from racgoat.models.comments import (
-    ReviewSession,
-    FileReview,
-    LineComment as SerLineComment,
-    RangeComment as SerRangeComment,
-    FileComment as SerFileComment,
-)
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from racgoat.constants import QUIT_OFFLOAD_MIN_LINES
+from racgoat.controllers.base import BaseController
+from racgoat.models.comments import ReviewSession
 from racgoat.ui.widgets.error_dialog import ErrorRecoveryScreen
 
 if TYPE_CHECKING:
     from racgoat.main import RacGoatApp
 
+T = TypeVar("T")
 
-class QuitController:
-    """Controller for quit and save operations."""
 
-    def __init__(self, app: "RacGoatApp"):
-        """Initialize the quit controller.
+class QuitController(BaseController):
+    """Controller for quit and save operations."""
 
-        Args:
-            app: Reference to the main RacGoatApp instance
-        """
-        self.app = app
+    __slots__ = ()
 
     def action_quit(self) -> None:
         """Quit the application and save review if comments exist.
 
         The raccoon stashes its treasures before departing!
         """
+        # A save is already running - it ends by exiting the app
+        if self.app._saving:
+            return
+        self.app._saving = True
+        self.app.refresh_bindings()
+
         # Run the actual quit logic in a worker so we can use push_screen_wait
         self.app.run_worker(self._do_quit(), exclusive=True)
 
@@ -51,16 +50,10 @@ class QuitController:
         # Diagnostic: Show comment count
         self.app.notify(f"Saving {comment_count} comment(s)...", severity="information")
 
-        # Convert comment store to ReviewSession
+        # Snapshot comments here on the event loop - the store is not
+        # thread-safe - then build the Markdown (off the loop for large diffs)
         review_session = self._create_review_session()
-
-        # Get git metadata (from service container)
-        branch_name, commit_sha = self.app.services.get_git_metadata()
-        review_session.branch_name = branch_name
-        review_session.commit_sha = commit_sha
-
-        # Serialize to Markdown (pass diff_summary for code context)
-        content = self.app.services.serialize_review_session(review_session, diff_summary=self.app.diff_summary)
+        content = await self._run_blocking(self._render_review, review_session)
 
         # Try to write to output file
         output_path = Path(self.app.output_file)
@@ -70,36 +63,20 @@ class QuitController:
 
         while retry_count < max_retries:
             try:
-                self.app.services.write_markdown_output(content, output_path)
+                await self._run_blocking(
+                    self.app.services.write_markdown_output, content, output_path
+                )
                 self.app.notify(f"Review saved to {output_path}", severity="information")
                 self.app.exit()
                 return
 
-            except FileExistsError:
-                # File already exists - show error recovery dialog
-                error_msg = f"Output file already exists: {output_path}"
-                last_error = error_msg
-                result = await self.app.push_screen_wait(
-                    ErrorRecoveryScreen(
-                        error_message=error_msg,
-                        show_tmp_fallback=True,
-                        original_path=str(output_path)
-                    )
-                )
-
-                if result is None:
-                    # User cancelled - exit without saving
-                    self.app.notify("Review not saved (cancelled by user)", severity="warning")
-                    self.app.exit()
-                    return
-                else:
-                    # User provided new path - retry with new path
-                    output_path = Path(result)
-                    retry_count += 1
-
             except OSError as e:
-                # Write error (permissions, invalid path, etc.)
-                error_msg = f"Cannot write to {output_path}: {e}"
+                # FileExistsError (no-overwrite) or any other write error
+                # (permissions, invalid path, etc.) - offer a new path
+                if isinstance(e, FileExistsError):
+                    error_msg = f"Output file already exists: {output_path}"
+                else:
+                    error_msg = f"Cannot write to {output_path}: {e}"
                 last_error = error_msg
                 result = await self.app.push_screen_wait(
                     ErrorRecoveryScreen(
@@ -114,10 +91,10 @@ class QuitController:
                     self.app.notify("Review not saved (cancelled by user)", severity="warning")
                     self.app.exit()
                     return
-                else:
-                    # User provided new path - retry with new path
-                    output_path = Path(result)
-                    retry_count += 1
+
+                # User provided new path - retry the write only; content is reused
+                output_path = Path(result)
+                retry_count += 1
 
         # Max retries exceeded - provide helpful guidance
         error_details = f"Last error: {last_error}" if last_error else "Unknown error occurred"
@@ -132,48 +109,55 @@ class QuitController:
         )
         self.app.exit()
 
-    def _create_review_session(self) -> ReviewSession:
-        """Convert comment store to ReviewSession for serialization.
+    async def _run_blocking(self, func: Callable[..., T], *args) -> T:
+        """Run blocking save work, in a worker thread only for large diffs.
+
+        Large reviews are built and written off the event loop so the UI keeps
+        drawing. Small ones run inline: the thread hop costs more than the work,
+        and an inline save cannot be cancelled mid-flight by app shutdown.
+
+        Args:
+            func: Blocking callable (serialization or file write)
+            *args: Positional arguments for func
 
         Returns:
-            ReviewSession with all comments organized by file
+            Whatever func returns
         """
-        # Get all unique comments from store using the unique tracker
-        file_reviews = {}
-
-        # Iterate through unique comments to avoid duplicates
-        for comment_id, comment in self.app.comment_store._unique_comments.items():
-            file_path = comment.target.file_path
-
-            # Create FileReview if not exists
-            if file_path not in file_reviews:
-                file_reviews[file_path] = FileReview(
-                    file_path=file_path,
-                    comments=[]
-                )
+        diff_summary = self.app.diff_summary
+        if diff_summary and diff_summary.total_line_count >= QUIT_OFFLOAD_MIN_LINES:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
 
-            # Convert to serializable comment based on type
-            if comment.target.is_line_comment:
-                ser_comment = SerLineComment(
-                    text=comment.text,
-                    line_number=comment.target.line_number
-                )
-            elif comment.target.is_range_comment:
-                start, end = comment.target.line_range
-                ser_comment = SerRangeComment(
-                    text=comment.text,
-                    start_line=start,
-                    end_line=end
-                )
-            elif comment.target.is_file_comment:
-                ser_comment = SerFileComment(text=comment.text)
-            else:
-                continue  # Skip unknown types
+    def _render_review(self, review_session: ReviewSession) -> str:
+        """Look up git metadata and serialize a review snapshot to Markdown.
+
+        Runs via _run_blocking - it shells out to git and builds the
+        whole output string - so it must not touch the comment store.
+
+        Args:
+            review_session: Comment snapshot from _create_review_session
 
-            file_reviews[file_path].comments.append(ser_comment)
+        Returns:
+            Markdown content ready to be written
+        """
+        # Get git metadata (from service container)
+        branch_name, commit_sha = self.app.services.get_git_metadata()
+        review_session.branch_name = branch_name
+        review_session.commit_sha = commit_sha
 
+        # Serialize to Markdown (pass diff_summary for code context)
+        return self.app.services.serialize_review_session(
+            review_session, diff_summary=self.app.diff_summary
+        )
+
+    def _create_review_session(self) -> ReviewSession:
+        """Convert comment store to ReviewSession for serialization.
+
+        Returns:
+            ReviewSession with all comments organized by file
+        """
         return ReviewSession(
-            file_reviews=file_reviews,
+            file_reviews=self.app.comment_store.file_reviews(),
             branch_name="Unknown Branch",
             commit_sha="Unknown SHA"
         )
@@ -5,20 +5,18 @@ The raccoon's sniffing logic lives here!
 
 from typing import TYPE_CHECKING
 
+from racgoat.controllers.base import BaseController
+from racgoat.ui.widgets.comment_input import CommentInput
+from racgoat.ui.widgets.help_screen import HelpScreen
+
 if TYPE_CHECKING:
     from racgoat.main import RacGoatApp
 
 
-class SearchController:
+class SearchController(BaseController):
     """Controller for search and navigation actions."""
 
-    def __init__(self, app: "RacGoatApp"):
-        """Initialize the search controller.
-
-        Args:
-            app: Reference to the main RacGoatApp instance
-        """
-        self.app = app
+    __slots__ = ()
 
     def action_initiate_search(self) -> None:
         """Initiate search mode (/ key).
@@ -26,18 +24,13 @@ class SearchController:
         The raccoon starts sniffing for patterns!
         """
         # Get DiffPane
-        from racgoat.ui.widgets import TwoPaneLayout
-
-        two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-        diff_pane = two_pane._diff_pane
+        diff_pane = self.diff_pane
 
         if not diff_pane or not diff_pane.current_file:
             self.app.notify("No file to search", severity="warning")
             return
 
         # Show input for search pattern
-        from racgoat.ui.widgets.comment_input import CommentInput
-
         def handle_search_input(result: str | None) -> None:
             if result:  # User provided search pattern
                 diff_pane.execute_search(result)
@@ -55,14 +48,8 @@ class SearchController:
         Returns:
             True if DiffPane has active search with matches
         """
-        try:
-            from racgoat.ui.widgets import TwoPaneLayout
-
-            two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-            diff_pane = two_pane._diff_pane
-            return diff_pane and bool(diff_pane.search_state.matches)
-        except:
-            return False
+        diff_pane = self.diff_pane
+        return diff_pane is not None and bool(diff_pane.search_state.matches)
 
     def action_cancel_search(self) -> None:
         """Clear search state (Esc key).
@@ -70,38 +57,39 @@ class SearchController:
         The raccoon forgets what it was looking for!
         """
         # Clear search state
-        from racgoat.ui.widgets import TwoPaneLayout
-
-        two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-        diff_pane = two_pane._diff_pane
+        diff_pane = self.diff_pane
         if diff_pane:
             diff_pane.clear_search()
         self.app.notify("Search cleared", severity="information")
 
+    def _navigate(self, direction: int) -> None:
+        """Step through search matches or files.
+
+        Args:
+            direction: 1 for next, -1 for previous
+        """
+        if self._is_search_active():
+            diff_pane = self.diff_pane
+            if direction > 0:
+                diff_pane.scroll_to_next_match()
+            else:
+                diff_pane.scroll_to_previous_match()
+            return
+
+        files_pane = self.files_pane
+        if files_pane:
+            if direction > 0:
+                files_pane.next_file()
+            else:
+                files_pane.previous_file()
+
     def action_next_item(self) -> None:
         """Navigate to next item (search match or file) (n key).
 
         Context-sensitive: If search is active, go to next match.
         Otherwise, go to next file.
         """
-        if self._is_search_active():
-            # Search mode: navigate to next match
-            from racgoat.ui.widgets import TwoPaneLayout
-
-            two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-            diff_pane = two_pane._diff_pane
-            diff_pane.scroll_to_next_match()
-        else:
-            # Normal mode: navigate to next file
-            try:
-                from racgoat.ui.widgets import TwoPaneLayout
-
-                two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-                files_pane = two_pane._files_pane
-                if files_pane:
-                    files_pane.next_file()
-            except:
-                pass
+        self._navigate(1)
 
     def action_previous_item(self) -> None:
         """Navigate to previous item (search match or file) (p key).
@@ -109,29 +97,11 @@ class SearchController:
         Context-sensitive: If search is active, go to previous match.
         Otherwise, go to previous file.
         """
-        if self._is_search_active():
-            # Search mode: navigate to previous match
-            from racgoat.ui.widgets import TwoPaneLayout
-
-            two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-            diff_pane = two_pane._diff_pane
-            diff_pane.scroll_to_previous_match()
-        else:
-            # Normal mode: navigate to previous file
-            try:
-                from racgoat.ui.widgets import TwoPaneLayout
-
-                two_pane = self.app.query_one(TwoPaneLayout, expect_type=TwoPaneLayout)
-                files_pane = two_pane._files_pane
-                if files_pane:
-                    files_pane.previous_file()
-            except:
-                pass
+        self._navigate(-1)
 
     def action_show_help(self) -> None:
         """Show help overlay with all keybindings (? key).
 
         The raccoon's complete treasure map!
         """
-        from racgoat.ui.widgets.help_screen import HelpScreen
         self.app.push_screen(HelpScreen())
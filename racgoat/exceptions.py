@@ -18,6 +18,8 @@ class DiffTooLargeError(Exception):
         message: User-friendly error text with raccoon/goat theme
     """
 
+    __slots__ = ("actual_lines", "limit")
+
     def __init__(self, actual_lines: int, limit: int = MAX_DIFF_LINES):
         """Initialize DiffTooLargeError.
 
@@ -27,11 +29,20 @@ class DiffTooLargeError(Exception):
         """
         self.actual_lines = actual_lines
         self.limit = limit
-        self.message = (
-            f"🦝 This diff is too large! RacGoat can handle up to {limit:,} lines,\n"
-            f"but this diff has {actual_lines:,}. Consider reviewing in smaller chunks. 🐐"
+        # Message is formatted on demand - most raises are caught, never shown
+        super().__init__(actual_lines, limit)
+
+    @property
+    def message(self) -> str:
+        """User-friendly error text, built only when read."""
+        return (
+            f"🦝 This diff is too large! RacGoat can handle up to {self.limit:,} lines,\n"
+            f"but this diff has {self.actual_lines:,}. Consider reviewing in smaller chunks. 🐐"
         )
-        super().__init__(self.message)
+
+    def __str__(self) -> str:
+        """Return the user-friendly message."""
+        return self.message
 
 
 class MalformedHunkError(Exception):
@@ -49,6 +60,8 @@ class MalformedHunkError(Exception):
         reason: Parse failure description
     """
 
+    __slots__ = ("hunk_index", "raw_hunk", "reason")
+
     def __init__(self, hunk_index: int, raw_hunk: str, reason: str):
         """Initialize MalformedHunkError.
 
@@ -3,34 +3,35 @@ RacGoat Main Application
 A TUI that's part raccoon mischief, part goat stubbornness!
 """
 
-from datetime import datetime
-
 from textual.app import App, ComposeResult
-from textual.containers import Container, Vertical
 from textual.reactive import reactive
-from textual.widgets import Header, Footer, Static, Button, Label, Input
+from textual.widgets import Header, Footer, Static
 from textual.binding import Binding
-from textual.design import ColorSystem
-from textual.theme import Theme
 
-from racgoat.parser.diff_parser import DiffParser
 from racgoat.parser.models import DiffSummary
 from racgoat.exceptions import DiffTooLargeError
 from racgoat.ui.widgets import TwoPaneLayout
+from racgoat.ui.widgets.status_bar import StatusBar
 from racgoat.ui.models import ApplicationMode, PaneFocusState
 from racgoat.di import ServiceContainer
-from racgoat.models.comments import Comment, CommentTarget, CommentType
 from racgoat.controllers import (
     CommentController,
     SearchController,
     QuitController,
     ThemeController,
 )
-from racgoat.constants import (
-    MODAL_WIDTH_LARGE,
-    MODAL_HEIGHT,
-    BUTTON_WIDTH,
-)
+from racgoat.constants import BUTTON_WIDTH
+
+
+# Actions that would start a second save or change the saved comments
+_SAVE_BLOCKED_ACTIONS = frozenset({
+    "quit",
+    "add_line_comment",
+    "add_file_comment",
+    "enter_select_mode",
+    "confirm_select_mode",
+    "edit_comment",
+})
 
 
 class RacGoatApp(App):
@@ -61,35 +62,6 @@ class RacGoatApp(App):
         color: $accent;
     }}
 
-    #main-container {{
-        width: {MODAL_WIDTH_LARGE};
-        height: {MODAL_HEIGHT};
-        border: heavy $primary;
-        padding: 2 4;
-        align: center middle;
-    }}
-
-    #title {{
-        width: 100%;
-        content-align: center middle;
-        text-style: bold;
-        color: $accent;
-        margin-bottom: 1;
-    }}
-
-    #message {{
-        width: 100%;
-        content-align: center middle;
-        margin-bottom: 2;
-    }}
-
-    #easter-egg {{
-        width: 100%;
-        content-align: center middle;
-        color: $warning;
-        margin-bottom: 1;
-    }}
-
     Button {{
         width: {BUTTON_WIDTH};
         margin: 1 0;
@@ -117,10 +89,6 @@ class RacGoatApp(App):
         Binding("ctrl+g", "toggle_goat_mode", "🐐 GOAT", show=False),
     ]
 
-    # Hidden easter egg flags - shhh, they're secrets! 🦝🐐
-    raccoon_mode_active = False
-    goat_mode_active = False
-
     def __init__(
         self,
         diff_summary: DiffSummary | None = None,
@@ -139,7 +107,6 @@ class RacGoatApp(App):
         super().__init__()
         self.diff_file = diff_file
         self.output_file = output_file
-        self.diff_input = None
 
         # Dependency injection: Use provided container or create new one
         self.services = services or ServiceContainer()
@@ -150,6 +117,17 @@ class RacGoatApp(App):
         self.quit_controller = QuitController(self)
         self.theme_controller = ThemeController(self)
 
+        # Layout widgets, cached by compose() (None for empty diffs)
+        self._two_pane: TwoPaneLayout | None = None
+        self._status_bar: StatusBar | None = None
+
+        # Set by QuitController once a save starts (see check_action)
+        self._saving = False
+
+        # Hidden easter egg flags - shhh, they're secrets! 🦝🐐
+        self.raccoon_mode_active = False
+        self.goat_mode_active = False
+
         # Easter egg themes setup
         self._original_theme = None
         self.theme_controller.create_and_register_themes()
@@ -159,18 +137,20 @@ class RacGoatApp(App):
             self.diff_summary = diff_summary
         elif diff_file:
             # Legacy: Load diff from file (Milestone 1 mode)
+            # Legacy path only - parser loaded lazily
+            from racgoat.parser.diff_parser import DiffParser, iter_diff_lines
+
             try:
-                with open(diff_file, "r") as f:
-                    self.diff_input = f.read()
-                # Parse the diff input
-                parser = DiffParser()
-                self.diff_summary = parser.parse(self.diff_input)
+                # Stream the file into the parser; the raw text is never kept
+                with open(diff_file, "rb") as f:
+                    self.diff_summary = DiffParser().parse_lines(
+                        iter_diff_lines(f.fileno())
+                    )
             except DiffTooLargeError:
                 # Re-raise to be handled at entry point
                 raise
-            except (OSError, IOError) as e:
+            except (OSError, IOError):
                 # File read error - will show error in UI
-                self.diff_input = ""
                 self.diff_summary = None
         else:
             # No diff provided - empty state
@@ -193,21 +173,20 @@ class RacGoatApp(App):
 
         For Milestone 3: Show TwoPaneLayout with StatusBar or empty message.
         """
-        from racgoat.ui.widgets.status_bar import StatusBar
-
         yield Header()
 
         # Check if we have a valid diff
         if self.diff_summary and not self.diff_summary.is_empty:
             # Milestone 3: Show two-pane layout with services
-            two_pane = TwoPaneLayout(
+            self._two_pane = TwoPaneLayout(
                 self.diff_summary,
                 services=self.services,
                 id="two-pane-layout"
             )
-            yield two_pane
+            yield self._two_pane
             # Milestone 3: Add status bar
-            yield StatusBar(id="status-bar")
+            self._status_bar = StatusBar(id="status-bar")
+            yield self._status_bar
         else:
             # Empty diff: Show friendly message
             yield Static(
@@ -232,17 +211,28 @@ class RacGoatApp(App):
 
     def watch_mode(self, new_mode: ApplicationMode) -> None:
         """Propagate mode changes to child widgets."""
-        if self.diff_summary and not self.diff_summary.is_empty:
-            try:
-                two_pane = self.query_one(TwoPaneLayout)
-                if two_pane._diff_pane:
-                    two_pane._diff_pane.app_mode = new_mode
-                status_bar = self.query_one("#status-bar")
-                if status_bar:
-                    status_bar.app_mode = new_mode
-            except:
-                # Widgets not mounted yet
-                pass
+        # Widgets cached in compose(); None until composed or for empty diffs
+        two_pane = self._two_pane
+        if two_pane and two_pane._diff_pane:
+            two_pane._diff_pane.app_mode = new_mode
+        if self._status_bar:
+            self._status_bar.app_mode = new_mode
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        """Disable quit and comment actions while the review is being saved.
+
+        Large reviews are saved in a worker thread, so keys stay live. A second
+        quit would start a competing save, and a new comment would miss the
+        snapshot already taken.
+
+        Args:
+            action: Name of the action about to run
+            parameters: Action parameters (unused)
+
+        Returns:
+            False to ignore the action, True to allow it
+        """
+        return not (self._saving and action in _SAVE_BLOCKED_ACTIONS)
 
     def action_cycle_focus(self) -> None:
         """Cycle focus between panes (Tab key)."""
@@ -343,6 +333,6 @@ if __name__ == "__main__":
     args = parse_arguments()
 
     # Determine diff source
-    diff_path = getattr(args, 'diff_file', None)
+    diff_path = args.diff_file
 
     main(diff_file=diff_path, output_file=args.output)
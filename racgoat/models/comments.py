@@ -25,7 +25,7 @@ class CommentType(Enum):
     FILE = "file"  # File-level comment
 
 
-@dataclass
+@dataclass(slots=True)
 class CommentTarget:
     """Identifies what a comment is attached to (line, range, or file).
 
@@ -46,15 +46,18 @@ class CommentTarget:
         if not self.file_path:
             raise ValueError("file_path must not be empty")
 
+        # Line and file targets (the common case) need no further checks
+        line_range = self.line_range
+        if line_range is None:
+            return
+
         # Cannot have both line_number and line_range set
-        if self.line_number is not None and self.line_range is not None:
+        if self.line_number is not None:
             raise ValueError("Cannot have both line_number and line_range set")
 
-        # Validate range if present
-        if self.line_range is not None:
-            start, end = self.line_range
-            if start > end:
-                raise ValueError(f"Invalid range: start ({start}) > end ({end})")
+        start, end = line_range
+        if start > end:
+            raise ValueError(f"Invalid range: start ({start}) > end ({end})")
 
     @property
     def is_line_comment(self) -> bool:
@@ -72,7 +75,7 @@ class CommentTarget:
         return self.line_number is None and self.line_range is None
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """Represents a piece of user feedback attached to a specific target in the diff.
 
@@ -101,6 +104,25 @@ class Comment:
         # Note: Text validation happens in CommentStore.add() to allow
         # flexible comment creation for testing/modification scenarios
 
+    @classmethod
+    def new_range(cls, file_path: str, start_line: int, end_line: int, text: str) -> "Comment":
+        """Build a range comment and its target in one step.
+
+        Args:
+            file_path: Path to the file being commented on
+            start_line: First line of the range (inclusive)
+            end_line: Last line of the range (inclusive)
+            text: The comment content
+
+        Returns:
+            A RANGE comment spanning start_line..end_line
+        """
+        return cls(
+            text=text,
+            target=CommentTarget(file_path=file_path, line_range=(start_line, end_line)),
+            comment_type=CommentType.RANGE,
+        )
+
 
 # ============================================================================
 # Milestone 4: Serialization Models
@@ -110,7 +132,7 @@ class Comment:
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SerializableComment:
     """Base class for serializable comments (Milestone 4).
 
@@ -134,13 +156,14 @@ class SerializableComment:
 
     def __post_init__(self):
         """Validate comment text constraints."""
-        if not self.text or len(self.text) < 1:
+        text_length = len(self.text)
+        if text_length == 0:
             raise ValueError("Comment text must not be empty (min 1 character)")
-        if len(self.text) > MAX_COMMENT_LENGTH:
+        if text_length > MAX_COMMENT_LENGTH:
             raise ValueError(f"Comment text exceeds maximum length ({MAX_COMMENT_LENGTH:,} characters)")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LineComment(SerializableComment):
     """Serializable comment attached to a specific line.
 
@@ -156,14 +179,13 @@ class LineComment(SerializableComment):
 
     def __post_init__(self):
         """Validate line number and comment text."""
-        # Call parent validation
-        object.__setattr__(self, 'comment_type', 'line')
-        super().__post_init__()
+        # Call parent validation (comment_type is set by the field default)
+        SerializableComment.__post_init__(self)
         if self.line_number < 1:
             raise ValueError("Line number must be positive (>= 1)")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RangeComment(SerializableComment):
     """Serializable comment spanning multiple consecutive lines.
 
@@ -181,15 +203,14 @@ class RangeComment(SerializableComment):
 
     def __post_init__(self):
         """Validate range bounds and comment text."""
-        object.__setattr__(self, 'comment_type', 'range')
-        super().__post_init__()
+        SerializableComment.__post_init__(self)
         if self.start_line < 1:
             raise ValueError("Start line must be positive (>= 1)")
         if self.end_line < self.start_line:
             raise ValueError(f"End line ({self.end_line}) must be >= start line ({self.start_line})")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileComment(SerializableComment):
     """Serializable file-level comment.
 
@@ -199,12 +220,11 @@ class FileComment(SerializableComment):
     comment_type: str = field(default="file", init=False)
 
     def __post_init__(self):
-        """Set comment type and validate text."""
-        object.__setattr__(self, 'comment_type', 'file')
-        super().__post_init__()
+        """Validate comment text."""
+        SerializableComment.__post_init__(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileReview:
     """Container for all comments on a single file.
 
@@ -226,7 +246,7 @@ class FileReview:
             raise ValueError(f"File has {len(self.comments)} comments, maximum is 100")
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewSession:
     """Top-level container for an entire review session.
 
@@ -265,7 +285,6 @@ class ReviewSession:
         Returns:
             Review ID in format YYYYMMDD-HHMMSS (e.g., "20250104-143022")
         """
-        from datetime import datetime
         return datetime.now().strftime("%Y%m%d-%H%M%S")
 
     @property
@@ -1,12 +1,14 @@
 """Core diff parsing logic with error handling for Milestone 6."""
 
+import io
+import os
 import re
-from typing import Optional
+from typing import Iterable, Iterator, Optional, TextIO
 
 from racgoat.parser.models import DiffFile, DiffHunk, DiffSummary
 from racgoat.parser.file_filter import FileFilter
 from racgoat.exceptions import DiffTooLargeError, MalformedHunkError
-from racgoat.constants import MAX_DIFF_LINES
+from racgoat.constants import MAX_DIFF_LINES, STDIN_CHUNK_SIZE
 
 
 def parse_file_header(line: str) -> Optional[str]:
@@ -76,13 +78,58 @@ def is_binary_marker(line: str) -> bool:
     return line.startswith("Binary files") and "differ" in line
 
 
-def parse_diff(lines: list[str]) -> DiffSummary:
+def iter_diff_lines(fd: int) -> Iterator[str]:
+    """Stream decoded diff lines from a file descriptor (e.g. piped stdin).
+
+    Lines are read through a STDIN_CHUNK_SIZE buffer and handed out one at a
+    time, so the diff is never held as one big string plus a list of lines.
+    Regular files also get a sequential-access readahead hint.
+
+    Args:
+        fd: Readable file descriptor; it is left open afterwards
+
+    Yields:
+        Diff lines with their trailing newline (undecodable bytes replaced)
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Pipes and ttys don't take advice
+
+    with open(
+        fd, "r", buffering=STDIN_CHUNK_SIZE,
+        encoding="utf-8", errors="replace", closefd=False
+    ) as stream:
+        yield from stream
+
+
+def iter_stream_lines(stream: TextIO) -> Iterator[str]:
+    """Stream diff lines from a text stream such as sys.stdin.
+
+    Streams backed by a real file descriptor go through iter_diff_lines();
+    in-memory substitutes (io.StringIO, test doubles) are iterated as-is.
+
+    Args:
+        stream: Readable text stream
+
+    Returns:
+        Iterator of diff lines with their trailing newline
+    """
+    try:
+        fd = stream.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return iter(stream)
+    return iter_diff_lines(fd)
+
+
+def parse_diff(lines: Iterable[str]) -> DiffSummary:
     """Parse git diff and extract file change statistics.
 
     Filters out binary files and generated files based on FileFilter rules.
 
     Args:
-        lines: Lines of diff output (from stdin or file)
+        lines: Lines of diff output (from stdin or file), any iterable
 
     Returns:
         DiffSummary containing all non-filtered files with their statistics
@@ -290,14 +337,29 @@ class DiffParser:
         lines = diff_text.splitlines(keepends=True)
         return self._parse_lines(lines)
 
-    def _parse_lines(self, lines: list[str]) -> DiffSummary:
+    def parse_lines(self, lines: Iterable[str]) -> DiffSummary:
+        """Parse git diff from an iterable of lines (e.g. a stream).
+
+        Args:
+            lines: Diff lines with trailing newlines, such as iter_diff_lines()
+
+        Returns:
+            DiffSummary with parsed files and metadata
+
+        Raises:
+            DiffTooLargeError: If total line count exceeds size_limit
+        """
+        return self._parse_lines(lines)
+
+    def _parse_lines(self, lines: Iterable[str]) -> DiffSummary:
         """Parse diff lines with malformed hunk detection.
 
         This method extends the existing parse_diff logic with:
         - Try/catch blocks around hunk parsing
         - Malformed hunk storage (is_malformed=True)
         - Total line count tracking
-        - Size limit enforcement
+        - Size limit enforcement (hunk content is discarded as soon as the
+          limit is crossed; only counting continues)
 
         Args:
             lines: Diff lines to parse
@@ -315,6 +377,9 @@ class DiffParser:
         current_added = 0
         current_removed = 0
         current_is_binary = False
+        # Whether the current file's added lines count toward size_limit
+        # (not binary, not filtered) - decided once per file, not per line
+        current_counts = False
         current_hunks: list[DiffHunk] = []
         current_hunk_lines: list[tuple[str, str]] = []
         current_hunk_old_start: Optional[int] = None
@@ -326,6 +391,7 @@ class DiffParser:
         line_number = 0
         has_diff_header = False
         in_hunk = False
+        keep_content = True  # False once the diff is known to exceed size_limit
 
         def save_current_hunk():
             """Save the current hunk (valid or malformed)."""
@@ -402,7 +468,7 @@ class DiffParser:
                 save_current_hunk()
 
                 # Check if file should be filtered
-                if current_is_binary or self.file_filter.is_filtered(current_file_path):
+                if not current_counts:
                     # Skip this file and increment counter
                     summary.binary_files_skipped += 1
                     current_hunks = []
@@ -410,6 +476,13 @@ class DiffParser:
 
                 # Calculate total lines for this file
                 file_total_lines = current_added  # Use added lines as "new" line count
+
+                if not keep_content:
+                    # Over the limit - only the count is still needed
+                    total_line_count += file_total_lines
+                    current_hunks = []
+                    return
+
                 has_malformed = any(h.is_malformed for h in current_hunks)
 
                 diff_file = DiffFile(
@@ -439,6 +512,7 @@ class DiffParser:
                 current_added = 0
                 current_removed = 0
                 current_is_binary = False
+                current_counts = False
                 current_hunks = []
                 current_hunk_lines = []
                 current_hunk_old_start = None
@@ -454,6 +528,7 @@ class DiffParser:
             # Binary marker
             if is_binary_marker(line):
                 current_is_binary = True
+                current_counts = False
                 continue
 
             # File header
@@ -464,6 +539,10 @@ class DiffParser:
                 current_added = 0
                 current_removed = 0
                 current_is_binary = False
+                current_counts = (
+                    current_file_path is not None
+                    and not self.file_filter.is_filtered(current_file_path)
+                )
                 current_hunks = []
                 current_hunk_lines = []
                 current_hunk_old_start = None
@@ -478,6 +557,8 @@ class DiffParser:
             # Hunk header with malformed detection
             if line.startswith("@@"):
                 save_current_hunk()
+                if not keep_content:
+                    continue
                 try:
                     old_start, old_count, new_start, new_count = parse_hunk_header(line, strict=True)
                     current_hunk_old_start = old_start
@@ -511,6 +592,21 @@ class DiffParser:
             # Count added and removed lines
             if line.startswith("+") and not line.startswith("+++"):
                 current_added += 1
+                if (
+                    keep_content
+                    and current_counts
+                    and total_line_count + current_added > self.size_limit
+                ):
+                    # Too large: drop stored content so memory stays bounded,
+                    # but keep counting so the error reports the real size
+                    keep_content = False
+                    in_hunk = False
+                    current_hunk_old_start = None
+                    current_hunk_new_start = None
+                    current_hunk_lines = []
+                    current_hunk_raw_text = []
+                    current_hunks = []
+                    summary.files.clear()
                 if in_hunk:
                     content = line[1:].rstrip('\n\r')
                     current_hunk_lines.append(('+', content))
@@ -6,9 +6,19 @@ CRUD operations for comments with efficient lookup by file path and line number.
 The raccoon's treasure cache - where all the shiny comments are stashed!
 """
 
-from typing import Optional
+from collections import defaultdict
+from typing import Iterator, Optional
 
-from racgoat.models.comments import Comment, CommentTarget, CommentType
+from racgoat.models.comments import (
+    Comment,
+    CommentTarget,
+    CommentType,
+    FileReview,
+    SerializableComment,
+    LineComment as SerLineComment,
+    RangeComment as SerRangeComment,
+    FileComment as SerFileComment,
+)
 
 
 class CommentStore:
@@ -100,6 +110,27 @@ class CommentStore:
         # Sort by timestamp (oldest first)
         return sorted(comments, key=lambda c: c.timestamp)
 
+    def get_one(self, target: CommentTarget) -> Optional[Comment]:
+        """Retrieve the oldest comment at a line or file target.
+
+        Equivalent to ``get(...)[0]`` without sorting the whole bucket.
+
+        Args:
+            target: Line or file-level CommentTarget
+
+        Returns:
+            Oldest comment at the target, or None if there is none
+
+        Raises:
+            ValueError: If target is a range (no single key to look up)
+        """
+        if target.is_range_comment:
+            raise ValueError("Cannot look up a range target directly (use get_by_id)")
+        comments = self._comments.get((target.file_path, target.line_number))
+        if not comments:
+            return None
+        return min(comments, key=lambda c: c.timestamp)
+
     def get_file_comments(self, file_path: str) -> list[Comment]:
         """Get all comments associated with a file (any type).
 
@@ -330,11 +361,42 @@ class CommentStore:
         """
         return len(self._unique_comments)
 
+    def iter_unique(self) -> Iterator[Comment]:
+        """Iterate over unique comments in insertion order.
+
+        Range comments are yielded once (not once per line).
+
+        Yields:
+            Each stored Comment exactly once
+        """
+        yield from self._unique_comments.values()
+
     def clear(self) -> None:
         """Remove all comments from the store."""
         self._comments.clear()
         self._unique_comments.clear()
 
+    def file_reviews(self) -> dict[str, FileReview]:
+        """Snapshot the stored comments as serialized reviews grouped by file.
+
+        Serializes the current state of every unique comment in a single pass,
+        so edits made directly on a returned Comment are picked up too.
+
+        Returns:
+            Map of file path to FileReview, ready for a ReviewSession
+
+        Raises:
+            ValueError: If a comment fails serialization constraints
+        """
+        grouped: dict[str, list[SerializableComment]] = defaultdict(list)
+        for comment in self._unique_comments.values():
+            grouped[comment.target.file_path].append(_to_serializable(comment))
+
+        return {
+            file_path: FileReview(file_path=file_path, comments=comments)
+            for file_path, comments in grouped.items()
+        }
+
     def get_comment_at_cursor(self, file_path: str, cursor_line: int) -> Optional[Comment]:
         """Get the first comment at cursor position (for edit operations).
 
@@ -363,3 +425,24 @@ class CommentStore:
             return self._comments[file_key][0]
 
         return None
+
+
+def _to_serializable(comment: Comment) -> SerializableComment:
+    """Convert a stored Comment into its serializable counterpart.
+
+    Args:
+        comment: Comment from the store
+
+    Returns:
+        LineComment, RangeComment, or FileComment matching the target
+
+    Raises:
+        ValueError: If the comment fails serialization constraints
+    """
+    target = comment.target
+    if target.is_line_comment:
+        return SerLineComment(text=comment.text, line_number=target.line_number)
+    if target.is_range_comment:
+        start, end = target.line_range
+        return SerRangeComment(text=comment.text, start_line=start, end_line=end)
+    return SerFileComment(text=comment.text)
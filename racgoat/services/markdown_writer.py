@@ -6,6 +6,7 @@ atomic operations. Handles file conflicts and write errors gracefully.
 The raccoon transforms its treasure hoard into readable scrolls!
 """
 
+import contextlib
 import tempfile
 import sys
 from pathlib import Path
@@ -322,15 +323,24 @@ def write_markdown_output(content: str, output_path: Union[str, Path]) -> None:
     except OSError as e:
         # Log OSError details (permissions, invalid path, disk full, etc.)
         print(f"[ERROR] OSError writing to {output_path}: {e} (errno: {e.errno})", file=sys.stderr)
-        # Clean up temp file on error
-        if temp_path and temp_path.exists():
-            temp_path.unlink()
+        _discard_temp_file(temp_path)
         raise
 
     except Exception as e:
         # Log unexpected errors
         print(f"[ERROR] Unexpected error writing to {output_path}: {type(e).__name__}: {e}", file=sys.stderr)
-        # Clean up temp file on error
-        if temp_path and temp_path.exists():
-            temp_path.unlink()
+        _discard_temp_file(temp_path)
         raise
+
+
+def _discard_temp_file(temp_path: Path | None) -> None:
+    """Remove a leftover temp file after a failed write.
+
+    Cleanup failures are ignored so they never mask the original error.
+
+    Args:
+        temp_path: Temp file to remove (None if it was never created)
+    """
+    if temp_path is not None:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
@@ -148,7 +148,7 @@ class DiffNavigation:
         Returns:
             Tuple of (new_current_line, new_select_end_line)
         """
-        if app_mode == ApplicationMode.SELECT:
+        if app_mode is ApplicationMode.SELECT:
             # SELECT mode: expand selection upward
             if select_end_line is not None and file.hunks:
                 # Get min line from first hunk
@@ -194,7 +194,7 @@ class DiffNavigation:
         Returns:
             Tuple of (new_current_line, new_select_end_line)
         """
-        if app_mode == ApplicationMode.SELECT:
+        if app_mode is ApplicationMode.SELECT:
             # SELECT mode: expand selection downward
             if select_end_line is not None and file.hunks:
                 # Get max line from last hunk
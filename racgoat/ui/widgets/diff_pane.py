@@ -15,9 +15,12 @@ from textual.containers import VerticalScroll
 from racgoat.parser.models import DiffFile
 from racgoat.constants import DIFF_PANE_WIDTH_PERCENT
 from racgoat.ui.models import ApplicationMode, SearchState
+from racgoat.ui.widgets.comment_input import CommentInput
+from racgoat.ui.widgets.dialogs import ConfirmDialog
 from racgoat.ui.widgets.diff_renderer import DiffRenderer
 from racgoat.ui.widgets.diff_navigation import DiffNavigation
 from racgoat.ui.widgets.diff_search import DiffSearch
+from racgoat.utils import line_span
 
 if TYPE_CHECKING:
     from racgoat.services.comment_store import CommentStore
@@ -83,6 +86,10 @@ class DiffPane(VerticalScroll):
         # Content widget
         self._content_widget: Static | None = None
 
+        # Queued redraw (see schedule_redraw); None range means whole file
+        self._redraw_pending = False
+        self._dirty_lines: tuple[int, int] | None = None
+
         # Per-file state tracking: {file_path: (scroll_y, current_line)}
         self._file_states: dict[str, tuple[float, int]] = {}
 
@@ -112,7 +119,12 @@ class DiffPane(VerticalScroll):
         self._content_widget = Static("", id="diff-content")
         yield self._content_widget
 
-    def display_file(self, file: DiffFile, refresh_only: bool = False) -> None:
+    def display_file(
+        self,
+        file: DiffFile,
+        refresh_only: bool = False,
+        dirty_lines: tuple[int, int] | None = None,
+    ) -> None:
         """Render diff hunks for a file.
 
         The goat carefully walks through each hunk, painting it with colors!
@@ -120,6 +132,8 @@ class DiffPane(VerticalScroll):
         Args:
             file: File to display (must have hunks populated)
             refresh_only: If True, only refresh rendering without changing scroll/cursor state
+            dirty_lines: With refresh_only, the inclusive line range whose
+                markers/highlights changed; other hunks are reused as-is
 
         Raises:
             ValueError: If file is None
@@ -152,6 +166,7 @@ class DiffPane(VerticalScroll):
             select_start_line=self.select_start_line,
             select_end_line=self.select_end_line,
             search_state=self.search_state,
+            dirty_lines=dirty_lines if refresh_only else None,
         )
 
         if self._content_widget:
@@ -166,6 +181,36 @@ class DiffPane(VerticalScroll):
                 # First time viewing - scroll to top
                 self.scroll_home(animate=False)
 
+    def schedule_redraw(self, dirty_lines: tuple[int, int] | None = None) -> None:
+        """Queue a single redraw of the current file for after the next refresh.
+
+        Key auto-repeat and back-to-back comment edits land in the same frame;
+        they collapse into one render - the goat only repaints the cliff once
+        per climb.
+
+        Args:
+            dirty_lines: Inclusive line range whose markers/highlights changed,
+                or None to redraw the whole file
+        """
+        if self._redraw_pending:
+            # Widen the queued range; a whole-file redraw swallows everything
+            if self._dirty_lines is None or dirty_lines is None:
+                self._dirty_lines = None
+            else:
+                self._dirty_lines = line_span(*self._dirty_lines, *dirty_lines)
+            return
+        self._redraw_pending = True
+        self._dirty_lines = dirty_lines
+        self.call_after_refresh(self._redraw)
+
+    def _redraw(self) -> None:
+        """Run the queued redraw and clear the pending flag."""
+        self._redraw_pending = False
+        if self.current_file:
+            self.display_file(
+                self.current_file, refresh_only=True, dirty_lines=self._dirty_lines
+            )
+
     def clear(self) -> None:
         """Clear diff content (show empty state).
 
@@ -205,10 +250,13 @@ class DiffPane(VerticalScroll):
         )
 
         if new_current != self.current_line or new_select_end != self.select_end_line:
+            dirty_lines = line_span(
+                self.current_line, new_current, self.select_end_line, new_select_end
+            )
             self.current_line = new_current
             self.select_end_line = new_select_end
-            self.display_file(self.current_file, refresh_only=True)
-            if self.app_mode == ApplicationMode.NORMAL:
+            self.schedule_redraw(dirty_lines)
+            if self.app_mode is ApplicationMode.NORMAL:
                 self.navigation.scroll_to_cursor(self.current_file, self.current_line)
 
     def action_move_down(self) -> None:
@@ -224,10 +272,13 @@ class DiffPane(VerticalScroll):
         )
 
         if new_current != self.current_line or new_select_end != self.select_end_line:
+            dirty_lines = line_span(
+                self.current_line, new_current, self.select_end_line, new_select_end
+            )
             self.current_line = new_current
             self.select_end_line = new_select_end
-            self.display_file(self.current_file, refresh_only=True)
-            if self.app_mode == ApplicationMode.NORMAL:
+            self.schedule_redraw(dirty_lines)
+            if self.app_mode is ApplicationMode.NORMAL:
                 self.navigation.scroll_to_cursor(self.current_file, self.current_line)
 
     def action_page_up(self) -> None:
@@ -245,8 +296,9 @@ class DiffPane(VerticalScroll):
         )
 
         if new_line and new_line != self.current_line:
+            dirty_lines = line_span(self.current_line, new_line)
             self.current_line = new_line
-            self.display_file(self.current_file, refresh_only=True)
+            self.schedule_redraw(dirty_lines)
             self.navigation.scroll_to_cursor(self.current_file, self.current_line)
 
     def action_page_down(self) -> None:
@@ -264,8 +316,9 @@ class DiffPane(VerticalScroll):
         )
 
         if new_line and new_line != self.current_line:
+            dirty_lines = line_span(self.current_line, new_line)
             self.current_line = new_line
-            self.display_file(self.current_file, refresh_only=True)
+            self.schedule_redraw(dirty_lines)
             self.navigation.scroll_to_cursor(self.current_file, self.current_line)
 
     # Search Functionality
@@ -351,9 +404,6 @@ class DiffPane(VerticalScroll):
             # Silent no-op if no comment at cursor (per FR-034)
             return
 
-        # Import here to avoid circular dependency
-        from racgoat.ui.widgets.comment_input import CommentInput
-
         # Show edit dialog with pre-filled text
         if self.app:
             self.app.push_screen(
@@ -393,8 +443,6 @@ class DiffPane(VerticalScroll):
         Args:
             comment: The Comment object to potentially delete
         """
-        from racgoat.ui.widgets.dialogs import ConfirmDialog
-
         if self.app:
             self.app.push_screen(
                 ConfirmDialog(
@@ -437,10 +485,6 @@ class DiffPane(VerticalScroll):
         Returns:
             Rich Text object with formatted hunk
         """
-        # Import here to avoid circular dependency
-        from racgoat.parser.models import DiffFile
-        from racgoat.ui.models import ApplicationMode, SearchState
-
         # Provide defaults for backward compatibility
         if file is None:
             file = DiffFile(file_path="", added_lines=0, removed_lines=0, hunks=[hunk])
@@ -9,6 +9,7 @@ from rich.text import Text
 
 from racgoat.parser.models import DiffFile, DiffHunk
 from racgoat.ui.models import ApplicationMode, SearchState
+from racgoat.utils import ordered
 
 if TYPE_CHECKING:
     from racgoat.services.comment_store import CommentStore
@@ -33,6 +34,11 @@ class DiffRenderer:
         self.comment_store = comment_store
         self.app = app
 
+        # Last render_file output, one (first_line, last_line, text) per hunk,
+        # so a dirty-line refresh can reuse untouched hunks
+        self._rendered_file: DiffFile | None = None
+        self._rendered_hunks: list[tuple[int, int, Text]] = []
+
     def render_file(
         self,
         file: DiffFile,
@@ -41,6 +47,7 @@ class DiffRenderer:
         select_start_line: int | None,
         select_end_line: int | None,
         search_state: SearchState,
+        dirty_lines: tuple[int, int] | None = None,
     ) -> Text:
         """Render diff content for a file.
 
@@ -51,12 +58,16 @@ class DiffRenderer:
             select_start_line: Start of selection range (SELECT mode)
             select_end_line: End of selection range (SELECT mode)
             search_state: Current search state
+            dirty_lines: Inclusive (start, end) post-change line range that
+                changed since the last render of this file. Only hunks
+                overlapping it are re-formatted; None re-formats every hunk.
 
         Returns:
             Rich Text object with formatted diff
         """
         # If no hunks, show message
         if not file.hunks:
+            self._rendered_file = None
             text = Text(
                 f"📄 {file.file_path}\n\n"
                 "File metadata only (no diff content available)",
@@ -72,11 +83,26 @@ class DiffRenderer:
             style="dim italic",
         )
 
+        # Only reuse hunks rendered for this very file
+        previous = None
+        if dirty_lines is not None and self._rendered_file is file:
+            previous = self._rendered_hunks
+            dirty_min, dirty_max = dirty_lines
+
         # Render each hunk
+        rendered = []
         for hunk_idx, hunk in enumerate(file.hunks):
             if hunk_idx > 0:
                 text.append("\n")  # Spacing between hunks
 
+            if previous is not None:
+                first_line, last_line, hunk_text = previous[hunk_idx]
+                if last_line < dirty_min or first_line > dirty_max:
+                    # Untouched hunk - the raccoon keeps the old painting
+                    rendered.append(previous[hunk_idx])
+                    text.append(hunk_text)
+                    continue
+
             hunk_text = self.format_hunk(
                 hunk=hunk,
                 file=file,
@@ -86,10 +112,30 @@ class DiffRenderer:
                 select_end_line=select_end_line,
                 search_state=search_state,
             )
+            first_line, last_line = self._hunk_line_span(hunk)
+            rendered.append((first_line, last_line, hunk_text))
             text.append(hunk_text)
 
+        self._rendered_file = file
+        self._rendered_hunks = rendered
         return text
 
+    @staticmethod
+    def _hunk_line_span(hunk: DiffHunk) -> tuple[int, int]:
+        """Post-change line numbers covered by a hunk.
+
+        Args:
+            hunk: Hunk to measure
+
+        Returns:
+            Inclusive (first, last) line span; empty (first > last) for
+            malformed or removal-only hunks, which never need re-formatting
+        """
+        if hunk.is_malformed:
+            return hunk.new_start, hunk.new_start - 1
+        new_lines = sum(1 for change_type, _ in hunk.lines if change_type != "-")
+        return hunk.new_start, hunk.new_start + new_lines - 1
+
     def format_hunk(
         self,
         hunk: DiffHunk,
@@ -142,8 +188,7 @@ class DiffRenderer:
         select_min = None
         select_max = None
         if select_start_line is not None and select_end_line is not None:
-            select_min = min(select_start_line, select_end_line)
-            select_max = max(select_start_line, select_end_line)
+            select_min, select_max = ordered(select_start_line, select_end_line)
 
         for change_type, content in hunk.lines:
             # Determine gutter marker
@@ -161,7 +206,7 @@ class DiffRenderer:
 
             # Check if this is the current line (for cursor in NORMAL mode)
             is_current = (
-                app_mode == ApplicationMode.NORMAL and
+                app_mode is ApplicationMode.NORMAL and
                 change_type != "-" and
                 current_line_num == current_line
             )
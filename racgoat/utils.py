@@ -136,6 +136,46 @@ def trash_panda_search(haystack: str, needle: str) -> bool:
     return needle.lower() in haystack.lower()
 
 
+def ordered(a: int, b: int) -> tuple[int, int]:
+    """
+    Return two values low-to-high - the goat always climbs uphill!
+
+    One comparison instead of a min()/max() pair.
+
+    Args:
+        a: First value
+        b: Second value
+
+    Returns:
+        (smaller, larger)
+
+    Example:
+        >>> ordered(9, 3)
+        (3, 9)
+    """
+    return (a, b) if a <= b else (b, a)
+
+
+def line_span(*lines: Optional[int]) -> Optional[tuple[int, int]]:
+    """
+    Smallest inclusive range covering the given lines - the raccoon's fence!
+
+    Args:
+        *lines: Line numbers; None entries are ignored
+
+    Returns:
+        (first, last), or None if no line was given
+
+    Example:
+        >>> line_span(12, None, 7)
+        (7, 12)
+    """
+    present = [line for line in lines if line is not None]
+    if not present:
+        return None
+    return min(present), max(present)
+
+
 def generate_goat_ascii_art() -> str:
     """
     Generate Mountain Goat ASCII art for GOAT mode.
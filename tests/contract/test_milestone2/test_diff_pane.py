@@ -160,6 +160,50 @@ class TestDiffPaneFormatHunk:
         assert '11' in plain_text
 
 
+class TestDiffRendererDirtyLines:
+    """Tests for dirty-line refreshes - only repaint the hunk that changed!"""
+
+    def test_dirty_lines_reformats_only_touched_hunks(self):
+        """Untouched hunks are reused, and the result matches a full render."""
+        from racgoat.models.comments import Comment, CommentTarget, CommentType
+        from racgoat.services.comment_store import CommentStore
+        from racgoat.ui.models import ApplicationMode, SearchState
+        from racgoat.ui.widgets.diff_renderer import DiffRenderer
+
+        file = DiffFile(
+            file_path="test.py",
+            added_lines=2,
+            removed_lines=0,
+            hunks=[
+                DiffHunk(old_start=1, new_start=1, lines=[('+', 'first')]),
+                DiffHunk(old_start=10, new_start=11, lines=[('+', 'second')]),
+            ]
+        )
+        store = CommentStore()
+        renderer = DiffRenderer(comment_store=store)
+        render_args = dict(
+            current_line=None,
+            app_mode=ApplicationMode.NORMAL,
+            select_start_line=None,
+            select_end_line=None,
+            search_state=SearchState(),
+        )
+
+        renderer.render_file(file, **render_args)
+        first_hunk = renderer._rendered_hunks[0][2]
+
+        store.add(Comment(
+            text="shiny",
+            target=CommentTarget("test.py", 11),
+            comment_type=CommentType.LINE,
+        ))
+        partial = renderer.render_file(file, dirty_lines=(11, 11), **render_args)
+
+        assert renderer._rendered_hunks[0][2] is first_hunk
+        assert "* " in renderer._rendered_hunks[1][2].plain
+        assert partial.plain == renderer.render_file(file, **render_args).plain
+
+
 class TestDiffPaneClear:
     """Tests for clear() - wiping the slate clean!"""
 
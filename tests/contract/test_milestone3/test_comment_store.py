@@ -332,3 +332,127 @@ def test_get_all_file_treasures():
     assert CommentType.FILE in types
     assert CommentType.LINE in types
     assert CommentType.RANGE in types
+
+
+def test_iter_unique_yields_range_once():
+    """The raccoon counts a range treasure once, no matter how many lines it spans."""
+    from racgoat.services.comment_store import CommentStore
+    from racgoat.models.comments import Comment, CommentTarget, CommentType
+
+    store = CommentStore()
+    line = Comment(
+        text="Line comment",
+        target=CommentTarget(file_path="den.py", line_number=3, line_range=None),
+        timestamp=datetime.now(),
+        comment_type=CommentType.LINE
+    )
+    ranged = Comment(
+        text="Range comment",
+        target=CommentTarget(file_path="den.py", line_number=None, line_range=(5, 9)),
+        timestamp=datetime.now(),
+        comment_type=CommentType.RANGE
+    )
+    store.add(line)
+    store.add(ranged)
+
+    assert list(store.iter_unique()) == [line, ranged]
+
+
+def test_file_reviews_track_mutations():
+    """The goat's serialized ledger stays in step with every stash and swipe."""
+    from racgoat.services.comment_store import CommentStore
+    from racgoat.models.comments import (
+        Comment,
+        CommentTarget,
+        CommentType,
+        LineComment,
+        RangeComment,
+    )
+
+    store = CommentStore()
+    line = Comment(
+        text="Line comment",
+        target=CommentTarget(file_path="den.py", line_number=3, line_range=None),
+        timestamp=datetime.now(),
+        comment_type=CommentType.LINE
+    )
+    ranged = Comment(
+        text="Range comment",
+        target=CommentTarget(file_path="den.py", line_number=None, line_range=(5, 9)),
+        timestamp=datetime.now(),
+        comment_type=CommentType.RANGE
+    )
+    store.add(line)
+    store.add(ranged)
+    store.update(line.id, "Edited")
+
+    reviews = store.file_reviews()
+    assert list(reviews) == ["den.py"]
+    assert reviews["den.py"].comments == [
+        LineComment(text="Edited", line_number=3),
+        RangeComment(text="Range comment", start_line=5, end_line=9),
+    ]
+
+    store.delete(line.id)
+    store.delete(ranged.id)
+    assert store.file_reviews() == {}
+
+
+def test_get_one_returns_oldest_at_target():
+    """The raccoon grabs the oldest treasure first, without sorting the pile."""
+    from racgoat.services.comment_store import CommentStore
+    from racgoat.models.comments import Comment, CommentTarget, CommentType
+
+    store = CommentStore()
+    target = CommentTarget(file_path="den.py", line_number=7, line_range=None)
+    newer = Comment(
+        text="Newer",
+        target=target,
+        timestamp=datetime(2025, 1, 2),
+        comment_type=CommentType.LINE
+    )
+    older = Comment(
+        text="Older",
+        target=target,
+        timestamp=datetime(2025, 1, 1),
+        comment_type=CommentType.LINE
+    )
+    store.add(newer)
+    store.add(older)
+
+    assert store.get_one(target) is older
+    assert store.get_one(CommentTarget(file_path="den.py", line_number=8)) is None
+    with pytest.raises(ValueError):
+        store.get_one(CommentTarget(file_path="den.py", line_range=(1, 3)))
+
+
+def test_file_reviews_reflect_direct_edits_and_readds():
+    """The snapshot is taken from the live stash, never from a stale ledger."""
+    from racgoat.services.comment_store import CommentStore
+    from racgoat.models.comments import (
+        Comment,
+        CommentTarget,
+        CommentType,
+        LineComment,
+    )
+
+    store = CommentStore()
+    comment = Comment(
+        text="Version 1",
+        target=CommentTarget(file_path="den.py", line_number=3, line_range=None),
+        timestamp=datetime.now(),
+        comment_type=CommentType.LINE
+    )
+    store.add(comment)
+
+    # Comments handed out by get() are live - edits show up in the snapshot
+    store.get("den.py", 3)[0].text = "Final version"
+    assert store.file_reviews()["den.py"].comments == [
+        LineComment(text="Final version", line_number=3),
+    ]
+
+    # Re-adding a stored comment then deleting it leaves nothing behind
+    store.add(comment)
+    store.delete(comment.id)
+    assert store.count() == 0
+    assert store.file_reviews() == {}
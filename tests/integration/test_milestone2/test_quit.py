@@ -37,3 +37,111 @@ class TestQuitApplication:
 
             # Verify: App has exited
             assert not app.is_running
+
+
+def _large_diff() -> DiffSummary:
+    """A diff just big enough for the review to be saved in a worker thread."""
+    from racgoat.constants import QUIT_OFFLOAD_MIN_LINES
+
+    lines = [('+', f'line {i}') for i in range(QUIT_OFFLOAD_MIN_LINES)]
+    return DiffSummary(files=[
+        DiffFile(
+            file_path="big.py",
+            added_lines=len(lines),
+            removed_lines=0,
+            hunks=[DiffHunk(old_start=1, new_start=1, lines=lines)]
+        ),
+    ], total_line_count=len(lines))
+
+
+class TestQuitLargeDiff:
+    """Saving a review of a large diff off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_large_diff_saves_review_in_worker_thread(self, tmp_path):
+        """Big diffs serialize in a thread, but the comment stash is read on the loop.
+
+        The raccoon counts its treasure at home, then hauls it out the back door!
+        """
+        import threading
+
+        from racgoat.models.comments import Comment, CommentTarget, CommentType
+
+        output_file = tmp_path / "review.md"
+
+        app = RacGoatApp(diff_summary=_large_diff(), output_file=str(output_file))
+        loop_thread = threading.get_ident()
+        threads = {}
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.comment_store.add(Comment(
+                text="Big treasure",
+                target=CommentTarget(file_path="big.py", line_number=7),
+                comment_type=CommentType.LINE,
+            ))
+
+            store, services = app.comment_store, app.services
+            file_reviews, serialize = store.file_reviews, services.serialize_review_session
+
+            def record_file_reviews():
+                threads["snapshot"] = threading.get_ident()
+                return file_reviews()
+
+            def record_serialize(*args, **kwargs):
+                threads["serialize"] = threading.get_ident()
+                return serialize(*args, **kwargs)
+
+            store.file_reviews = record_file_reviews
+            services.serialize_review_session = record_serialize
+
+            app.action_quit()
+            await app.workers.wait_for_complete()
+
+        assert threads["snapshot"] == loop_thread
+        assert threads["serialize"] != loop_thread
+        assert "Big treasure" in output_file.read_text()
+
+    @pytest.mark.asyncio
+    async def test_keys_during_save_do_not_start_another(self, tmp_path):
+        """Quit and comment keys are ignored while the review is being written.
+
+        One trip to the stash - a second 'q' must not send the raccoon back!
+        """
+        import time
+
+        from racgoat.models.comments import Comment, CommentTarget, CommentType
+        from racgoat.ui.widgets.comment_input import CommentInput
+        from racgoat.ui.widgets.error_dialog import ErrorRecoveryScreen
+
+        output_file = tmp_path / "review.md"
+        app = RacGoatApp(diff_summary=_large_diff(), output_file=str(output_file))
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.comment_store.add(Comment(
+                text="Only treasure",
+                target=CommentTarget(file_path="big.py", line_number=1),
+                comment_type=CommentType.LINE,
+            ))
+
+            write = app.services.write_markdown_output
+
+            def slow_write(*args):
+                time.sleep(0.3)
+                return write(*args)
+
+            app.services.write_markdown_output = slow_write
+
+            await pilot.press("q")
+            await pilot.pause(0.1)
+            await pilot.press("q", "c")
+            await pilot.pause(0.5)
+
+            # No comment prompt, and no "file already exists" from a second save
+            assert not any(
+                isinstance(screen, (CommentInput, ErrorRecoveryScreen))
+                for screen in app.screen_stack
+            )
+
+        assert "Only treasure" in output_file.read_text()
@@ -232,3 +232,88 @@ class TestVisualMarkers:
             assert len(app.comment_store.get("sparse.py", 3)) == 1
             assert len(app.comment_store.get("sparse.py", 4)) == 0
             assert len(app.comment_store.get("sparse.py", 5)) == 0
+
+
+def _two_hunk_diff() -> DiffSummary:
+    """A file whose hunks are far apart (lines 1-3 and 20-21)."""
+    return DiffSummary(files=[
+        DiffFile(
+            file_path="den.py",
+            added_lines=5,
+            removed_lines=0,
+            hunks=[
+                DiffHunk(old_start=1, new_start=1, lines=[
+                    ('+', 'line1'),
+                    ('+', 'line2'),
+                    ('+', 'line3'),
+                ]),
+                DiffHunk(old_start=17, new_start=20, lines=[
+                    ('+', 'line20'),
+                    ('+', 'line21'),
+                ]),
+            ]
+        ),
+    ])
+
+
+def _gutter_markers(diff_pane) -> list[str]:
+    """First character of every rendered line, e.g. '*' or '>'."""
+    return [line[:1] for line in diff_pane._content_widget.content.plain.splitlines()]
+
+
+class TestMarkerRedraws:
+    """Partial redraws must still repaint every hunk whose markers changed."""
+
+    @pytest.mark.asyncio
+    async def test_deleting_range_comment_clears_all_its_markers(self):
+        """Deleting a range via `c` on one of its lines clears the far hunk too."""
+        diff_summary = _two_hunk_diff()
+        app = RacGoatApp(diff_summary=diff_summary)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            app.comment_store.add(Comment.new_range("den.py", 1, 21, "Wide stash"))
+
+            await pilot.press("tab")  # Focus diff pane (renders markers)
+            await pilot.press("down")  # Line 2, inside the range
+            await pilot.pause()
+            diff_pane = app.query_one("#diff-pane")
+            assert _gutter_markers(diff_pane).count("*") == 4
+
+            # Clear the prefilled text and confirm the deletion
+            await pilot.press("c")
+            await pilot.pause()
+            app.screen.query_one("#comment-input").value = ""  # type: ignore[unresolved-attribute]
+            await pilot.press("enter")
+            await pilot.pause()
+            await pilot.press("enter")
+            await pilot.pause()
+
+            assert app.comment_store.count() == 0
+            assert "*" not in _gutter_markers(diff_pane)
+
+    @pytest.mark.asyncio
+    async def test_abandoned_range_prompt_clears_selection(self):
+        """Escaping the range prompt leaves no stale selection markers behind."""
+        diff_summary = _two_hunk_diff()
+        app = RacGoatApp(diff_summary=diff_summary)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.press("tab")  # Focus diff pane
+            await pilot.press("s")
+            diff_pane = app.query_one("#diff-pane")
+            for _ in range(25):  # Expand from line 1 across both hunks
+                if diff_pane.select_end_line == 21:  # type: ignore[unresolved-attribute]
+                    break
+                await pilot.press("down")
+            await pilot.pause()
+            assert diff_pane.select_end_line == 21  # type: ignore[unresolved-attribute]
+
+            await pilot.press("enter")  # Confirm selection, opens prompt
+            await pilot.pause()
+            await pilot.press("escape")  # Abandon the comment
+            await pilot.pause()
+            await pilot.press("down")
+            await pilot.pause()
+
+            # Only the NORMAL-mode cursor remains
+            assert _gutter_markers(diff_pane).count(">") == 1
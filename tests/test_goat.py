@@ -11,6 +11,8 @@ from racgoat.utils import (
     goat_path,
     trash_panda_search,
     generate_ascii_art,
+    ordered,
+    line_span,
 )
 
 
@@ -101,6 +103,20 @@ def test_trash_panda_search_case_insensitive():
     assert trash_panda_search("racgoat", "RACGOAT") is True
 
 
+def test_ordered_sorts_pair():
+    """The goat always climbs from low to high!"""
+    assert ordered(3, 9) == (3, 9)
+    assert ordered(9, 3) == (3, 9)
+    assert ordered(5, 5) == (5, 5)
+
+
+def test_line_span_covers_lines():
+    """The raccoon's fence covers every line it was handed, ignoring gaps!"""
+    assert line_span(12, None, 7) == (7, 12)
+    assert line_span(4) == (4, 4)
+    assert line_span(None) is None
+
+
 def test_ascii_art_exists():
     """Make sure we have our beautiful ASCII art!"""
     art = generate_ascii_art()
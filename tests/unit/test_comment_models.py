@@ -167,3 +167,36 @@ class TestReviewSessionValidations:
 
         session = ReviewSession(file_reviews=file_reviews)
         assert session.total_comment_count == 5
+
+
+class TestCommentFactories:
+    """Test convenience constructors for storage comments."""
+
+    def test_new_range_builds_target(self):
+        """Range factory sets target, type and a timestamp in one call."""
+        from racgoat.models.comments import Comment, CommentType
+
+        comment = Comment.new_range("den.py", 3, 7, "Shiny range")
+
+        assert comment.text == "Shiny range"
+        assert comment.comment_type is CommentType.RANGE
+        assert comment.target.file_path == "den.py"
+        assert comment.target.line_range == (3, 7)
+        assert comment.target.is_range_comment
+        assert comment.timestamp is not None
+
+
+class TestModelSlots:
+    """Test that comment models stay compact (slotted, no per-instance dict)."""
+
+    def test_serializable_comments_are_slotted(self):
+        """Subclasses keep their fixed comment_type and carry no __dict__."""
+        line = LineComment(text="Slotted", line_number=3)
+        file_comment = FileComment(text="Whole den")
+
+        assert line.comment_type == "line"
+        assert file_comment.comment_type == "file"
+        assert not hasattr(line, "__dict__")
+        assert not hasattr(file_comment, "__dict__")
+        with pytest.raises(AttributeError):
+            line.text = "mutated"
@@ -10,7 +10,11 @@ Tests validate:
 """
 
 import pytest
+from racgoat.exceptions import DiffTooLargeError
 from racgoat.parser.diff_parser import (
+    DiffParser,
+    iter_diff_lines,
+    iter_stream_lines,
     parse_diff,
     parse_file_header,
     parse_hunk_header,
@@ -299,3 +303,101 @@ index abcdefg..0000000
     assert summary.files[0].file_path == "old_file.py"
     assert summary.files[0].added_lines == 0
     assert summary.files[0].removed_lines == 3
+
+
+def test_iter_diff_lines_streams_from_fd(tmp_path):
+    """Test that iter_diff_lines yields newline-terminated lines from an fd."""
+    diff_path = tmp_path / "stream.diff"
+    diff_path.write_bytes(
+        b"diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n"
+        b"@@ -1,1 +1,1 @@\n-old\n+new \xff\n"
+    )
+
+    with open(diff_path, "rb") as f:
+        lines = list(iter_diff_lines(f.fileno()))
+        # fd is left open for the caller
+        assert not f.closed
+
+    assert len(lines) == 6
+    assert all(line.endswith("\n") for line in lines)
+    assert lines[-1] == "+new \ufffd\n"
+
+
+def test_iter_stream_lines_accepts_in_memory_stdin():
+    """Test that a substituted stdin without a file descriptor still parses."""
+    import io
+
+    stream = io.StringIO("diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n-old\n+new\n")
+
+    summary = DiffParser().parse_lines(iter_stream_lines(stream))
+
+    assert summary.files[0].file_path == "a.py"
+    assert summary.files[0].added_lines == 1
+
+
+def test_diff_parser_parse_lines_accepts_generator():
+    """Test that DiffParser.parse_lines consumes a one-shot iterator."""
+    diff_content = """\
+diff --git a/gen.py b/gen.py
+--- a/gen.py
++++ b/gen.py
+@@ -1,2 +1,2 @@
+-old
++new
+ same
+"""
+    lines = (line for line in diff_content.splitlines(keepends=True))
+
+    summary = DiffParser().parse_lines(lines)
+
+    assert summary == DiffParser().parse(diff_content)
+    assert summary.files[0].added_lines == 1
+    assert summary.files[0].removed_lines == 1
+
+
+def test_diff_parser_size_limit_counts_past_limit_without_filtered_files():
+    """Test that the size limit reports the full count of non-filtered lines.
+
+    Content is dropped once the limit is crossed, but counting continues
+    (generated files never count toward the limit).
+    """
+    def file_diff(path: str, added: int) -> list[str]:
+        return [
+            f"diff --git a/{path} b/{path}\n",
+            f"--- a/{path}\n",
+            f"+++ b/{path}\n",
+            f"@@ -0,0 +1,{added} @@\n",
+        ] + [f"+line {i}\n" for i in range(added)]
+
+    lines = file_diff("a.py", 6) + file_diff("yarn.lock", 50) + file_diff("b.py", 6)
+
+    with pytest.raises(DiffTooLargeError) as exc_info:
+        DiffParser(size_limit=10).parse_lines(iter(lines))
+
+    assert exc_info.value.actual_lines == 12
+    assert exc_info.value.limit == 10
+
+    # A large generated file alone never trips the limit
+    summary = DiffParser(size_limit=10).parse_lines(file_diff("yarn.lock", 50) + file_diff("a.py", 6))
+    assert summary.total_line_count == 6
+    assert summary.binary_files_skipped == 1
+
+
+def test_diff_parser_filters_each_file_once():
+    """The filter verdict is taken per file, not per added line."""
+    lines = [
+        "diff --git a/yarn.lock b/yarn.lock\n",
+        "--- a/yarn.lock\n",
+        "+++ b/yarn.lock\n",
+        "@@ -0,0 +1,50 @@\n",
+    ] + [f"+dep {i}\n" for i in range(50)]
+
+    parser = DiffParser(size_limit=10)
+    calls = []
+    original = parser.file_filter.is_filtered
+    parser.file_filter.is_filtered = lambda path: calls.append(path) or original(path)
+
+    summary = parser.parse_lines(iter(lines))
+
+    assert calls == ["yarn.lock"]
+    assert summary.binary_files_skipped == 1
@@ -3,6 +3,8 @@
 The raccoon tests its treasure map organization!
 """
 
+import pytest
+
 from racgoat.di import ServiceContainer
 from racgoat.services.comment_store import CommentStore
 
@@ -69,3 +71,29 @@ def test_service_container_reset():
 
     # Should be a new instance
     assert comment_store1 is not comment_store2
+
+
+def test_service_container_unknown_attribute_raises():
+    """Misspelled service names raise instead of returning a service."""
+    container = ServiceContainer()
+
+    with pytest.raises(AttributeError):
+        container.coment_store  # noqa: B018
+
+
+def test_entry_points_do_not_share_comments_between_runs(monkeypatch):
+    """Each launch gets a fresh stash - no leftover treasure from the last run."""
+    from racgoat.main import RacGoatApp, main
+    from racgoat.models.comments import Comment, CommentTarget, CommentType
+
+    launched = []
+    monkeypatch.setattr(RacGoatApp, "run", lambda self, **kwargs: launched.append(self))
+
+    main()
+    launched[0].services.comment_store.add(Comment(
+        text="stale", target=CommentTarget("a.py", 1), comment_type=CommentType.LINE,
+    ))
+    main()
+
+    assert launched[1].services is not launched[0].services
+    assert launched[1].services.comment_store.count() == 0